@@ -7,7 +7,7 @@ from pulpcore.app import models
 from pulpcore.app.serializers import base, ValidateFieldsMixin
 
 
-CONTENT_RANGE_PATTERN = r"^bytes (\d+)-(\d+)/(\d+|[*])$"
+CONTENT_RANGE_PATTERN = re.compile(r"^bytes (\d+)-(\d+)/(\d+|[*])$")
 
 
 class UploadChunkSerializer(ValidateFieldsMixin, serializers.Serializer):
@@ -28,7 +28,7 @@ class UploadChunkSerializer(ValidateFieldsMixin, serializers.Serializer):
         data = super().validate(data)
 
         content_range = self.context["request"].META.get("HTTP_CONTENT_RANGE", "")
-        match = re.compile(CONTENT_RANGE_PATTERN).match(content_range)
+        match = CONTENT_RANGE_PATTERN.match(content_range)
         if not match:
             raise serializers.ValidationError(_("Invalid or missing content range header."))
         data["start"] = start = int(match[1])
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 
 import aiohttp
@@ -9,7 +8,7 @@ from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.db import connection
 from django.contrib.auth import get_user_model
-from google.protobuf.json_format import MessageToJson
+from google.protobuf.json_format import MessageToDict
 
 from pulpcore.app.apps import pulp_plugin_configs
 from pulpcore.app.models import SystemID, Group, Domain, AccessPolicy
@@ -127,7 +126,7 @@ async def post_analytics():
                         logger.info(
                             ("Submitted analytics to %s. " "Information submitted includes %s"),
                             url,
-                            json.loads(MessageToJson(analytics)),
+                            MessageToDict(analytics),
                         )
                     else:
                         logger.warning(
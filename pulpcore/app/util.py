@@ -408,6 +408,28 @@ def get_default_domain():
     return default_domain
 
 
+def get_domain_by_name(name):
+    """
+    Get the Domain with the given name, using the cached default Domain when possible.
+
+    The default Domain can not be changed, so looking it up skips the database query. Note that if
+    the default Domain does not exist yet, `get_default_domain()` creates and saves it, so a request
+    for it will no longer return a 404.
+
+    Args:
+        name (str): The name of the Domain.
+
+    Returns:
+        pulpcore.app.models.Domain: The Domain with the given name.
+
+    Raises:
+        Domain.DoesNotExist: If no Domain with the given name exists.
+    """
+    if name == "default":
+        return get_default_domain()
+    return models.Domain.objects.get(name=name)
+
+
 def get_domain():
     return current_domain.get() or get_default_domain()
 
@@ -83,9 +83,13 @@ class Cache:
     def set(self, key, value, expires=None, base_key=None):
         """Sets the cached entry at key"""
         base_key = base_key or self.default_base_key
-        ret = self.redis.hset(base_key, key, value)
-        if expires:
-            self.redis.expire(base_key, expires)
+        if not expires:
+            return self.redis.hset(base_key, key, value)
+        # Send both commands in one round-trip
+        with self.redis.pipeline() as pipe:
+            pipe.hset(base_key, key, value)
+            pipe.expire(base_key, expires)
+            ret, _ = pipe.execute()
         return ret
 
     @connection_error_wrapper
@@ -251,9 +255,13 @@ class AsyncCache:
     async def set(self, key, value, expires=None, base_key=None):
         """Sets the cached entry at key"""
         base_key = base_key or self.default_base_key
-        ret = await self.redis.hset(base_key, key, value)
-        if expires:
-            await self.redis.expire(base_key, expires)
+        if not expires:
+            return await self.redis.hset(base_key, key, value)
+        # Send both commands in one round-trip
+        async with self.redis.pipeline() as pipe:
+            pipe.hset(base_key, key, value)
+            pipe.expire(base_key, expires)
+            ret, _ = await pipe.execute()
         return ret
 
     @aconnection_error_wrapper
@@ -366,7 +374,7 @@ class AsyncContentCache(AsyncCache):
         response_type = entry.pop("type", None)
         if not response_type or response_type not in self.RESPONSE_TYPES:
             # Bad entry, delete from cache
-            self.delete(key, base_key)
+            await self.delete(key, base_key)
             return None
         response = self.RESPONSE_TYPES[response_type](**entry)
         response.headers.update({"X-PULP-CACHE": "HIT"})
@@ -11,7 +11,7 @@ from rest_framework.exceptions import APIException
 
 from .handler import Handler, PathNotResolved
 from pulpcore.app.models import Domain
-from pulpcore.app.util import set_domain
+from pulpcore.app.util import get_domain_by_name, set_domain
 
 log = logging.getLogger(__name__)
 _ = gettext.gettext
@@ -76,7 +76,7 @@ def validate_domain(request):
     """
     domain_name = request.match_info.get("pulp_domain", "default")
     try:
-        domain = Domain.objects.get(name=domain_name)
+        domain = get_domain_by_name(domain_name)
     except Domain.DoesNotExist:
         path = request.match_info.get("path", "")
         if settings.DOMAIN_ENABLED:
@@ -55,6 +55,36 @@ from pulpcore.cache import AsyncContentCache  # noqa: E402
 log = logging.getLogger(__name__)
 
 
+DIRECTORY_LISTING_TEMPLATE = Template(
+    """
+<html>
+<head><title>Index of {{ path }}</title></head>
+<body bgcolor="white">
+<h1>Index of {{ path }}</h1>
+<hr><pre>
+{%- if not root %}<a href="../">../</a>{% endif %}
+{% for name in dir_list -%}
+{% if dates.get(name, "") -%}
+{% set date = dates.get(name).strftime("%d-%b-%Y %H:%M") -%}
+{% else -%}
+{% set date = "" -%}
+{% endif -%}
+{% if sizes.get(name, "") -%}
+{% set size | filesizeformat -%}
+{{ sizes.get(name) }}
+{% endset -%}
+{% else -%}
+{% set size = "" -%}
+{% endif -%}
+<a href="{{ name|e }}">{{ name|e }}</a>{% for number in range(100 - name|e|length) %} """
+    """{% endfor %}{{ date }}  {{ size }}
+{% endfor -%}
+</pre><hr></body>
+</html>
+"""
+)
+
+
 class PathNotResolved(HTTPNotFound):
     """
     The path could not be resolved to a published file.
@@ -308,9 +338,8 @@ class Handler:
                     raise DistroListings(path=path, distros=distros)
 
             log.debug(
-                _("Distribution not matched for {path} using: {base_paths}").format(
-                    path=path, base_paths=base_paths
-                )
+                _("Distribution not matched for %(path)s using: %(base_paths)s"),
+                {"path": path, "base_paths": base_paths},
             )
 
         raise PathNotResolved(path)
@@ -373,35 +402,7 @@ class Handler:
         """
         dates = dates or {}
         sizes = sizes or {}
-        template = Template(
-            """
-<html>
-<head><title>Index of {{ path }}</title></head>
-<body bgcolor="white">
-<h1>Index of {{ path }}</h1>
-<hr><pre>
-{%- if not root %}<a href="../">../</a>{% endif %}
-{% for name in dir_list -%}
-{% if dates.get(name, "") -%}
-{% set date = dates.get(name).strftime("%d-%b-%Y %H:%M") -%}
-{% else -%}
-{% set date = "" -%}
-{% endif -%}
-{% if sizes.get(name, "") -%}
-{% set size | filesizeformat -%}
-{{ sizes.get(name) }}
-{% endset -%}
-{% else -%}
-{% set size = "" -%}
-{% endif -%}
-<a href="{{ name|e }}">{{ name|e }}</a>{% for number in range(100 - name|e|length) %} """
-            """{% endfor %}{{ date }}  {{ size }}
-{% endfor -%}
-</pre><hr></body>
-</html>
-"""
-        )
-        return template.render(
+        return DIRECTORY_LISTING_TEMPLATE.render(
             dir_list=sorted(directory_list),
             dates=dates,
             path=path,
@@ -616,7 +617,7 @@ class Handler:
 
                 except MultipleObjectsReturned:
                     log.error(
-                        "Multiple (pass-through) matches for {b}/{p}",
+                        "Multiple (pass-through) matches for %(b)s/%(p)s",
                         {"b": distro.base_path, "p": rel_path},
                     )
                     raise
@@ -658,7 +659,7 @@ class Handler:
 
             except MultipleObjectsReturned:
                 log.error(
-                    "Multiple (pass-through) matches for {b}/{p}",
+                    "Multiple (pass-through) matches for %(b)s/%(p)s",
                     {"b": distro.base_path, "p": rel_path},
                 )
                 raise
@@ -741,9 +742,7 @@ class Handler:
 
             except (ClientResponseError, UnsupportedDigestValidationError) as e:
                 log.warning(
-                    "Could not download remote artifact at '{}': {}".format(
-                        remote_artifact.url, str(e)
-                    )
+                    "Could not download remote artifact at '%s': %s", remote_artifact.url, e
                 )
                 continue
 
@@ -910,9 +909,12 @@ class Handler:
 
         remote = await remote_artifact.remote.acast()
         log.debug(
-            "Streaming content for {url} from Remote {remote}-{source}".format(
-                url=request.match_info["path"], remote=remote.name, source=remote_artifact.url
-            )
+            "Streaming content for %(url)s from Remote %(remote)s-%(source)s",
+            {
+                "url": request.match_info["path"],
+                "remote": remote.name,
+                "source": remote_artifact.url,
+            },
         )
 
         # According to RFC7233 if a server cannot satisfy a Range request, the response needs to
@@ -2,6 +2,7 @@ from aiohttp import __version__ as aiohttp_version
 import asyncio
 import atexit
 import copy
+from functools import lru_cache
 from gettext import gettext as _
 from multidict import MultiDict
 import platform
@@ -76,10 +77,12 @@ class DownloaderFactory:
             "file": self._generic,
         }
         self._session = self._make_aiohttp_session_from_remote()
+        self._auth, self._proxy_auth = self._make_basic_auth_from_remote()
         self._semaphore = asyncio.Semaphore(value=download_concurrency)
         atexit.register(self._session_cleanup)
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def user_agent():
         """
         Produce a User-Agent string to identify Pulp and relevant system info.
@@ -146,6 +149,24 @@ class DownloaderFactory:
             connector=conn, timeout=timeout, headers=headers, requote_redirect_url=False
         )
 
+    def _make_basic_auth_from_remote(self):
+        """
+        Build the basic auth objects shared by all downloaders created by this factory.
+
+        Returns:
+            tuple: The (auth, proxy_auth) pair of :class:`aiohttp.BasicAuth`, either may be None.
+        """
+        auth = None
+        if self._remote.username and self._remote.password:
+            auth = aiohttp.BasicAuth(login=self._remote.username, password=self._remote.password)
+
+        proxy_auth = None
+        if self._remote.proxy_username and self._remote.proxy_password:
+            proxy_auth = aiohttp.BasicAuth(
+                login=self._remote.proxy_username, password=self._remote.proxy_password
+            )
+        return auth, proxy_auth
+
     def build(self, url, **kwargs):
         """
         Build a downloader which can optionally verify integrity using either digest or size.
@@ -195,15 +216,11 @@ class DownloaderFactory:
         options = {"session": self._session}
         if self._remote.proxy_url:
             options["proxy"] = self._remote.proxy_url
-            if self._remote.proxy_username and self._remote.proxy_password:
-                options["proxy_auth"] = aiohttp.BasicAuth(
-                    login=self._remote.proxy_username, password=self._remote.proxy_password
-                )
+            if self._proxy_auth:
+                options["proxy_auth"] = self._proxy_auth
 
-        if self._remote.username and self._remote.password:
-            options["auth"] = aiohttp.BasicAuth(
-                login=self._remote.username, password=self._remote.password
-            )
+        if self._auth:
+            options["auth"] = self._auth
 
         kwargs["throttler"] = self._remote.download_throttler if self._remote.rate_limit else None
 
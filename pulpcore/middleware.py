@@ -1,5 +1,5 @@
 from pulpcore.app.models import Domain
-from pulpcore.app.util import set_current_user_lazy, set_domain
+from pulpcore.app.util import get_domain_by_name, set_current_user_lazy, set_domain
 from django.http.response import Http404
 
 
@@ -32,7 +32,7 @@ class DomainMiddleware:
         """Remove the domain name if present, called right before view_func is called."""
         domain_name = view_kwargs.pop("pulp_domain", "default")
         try:
-            domain = Domain.objects.get(name=domain_name)
+            domain = get_domain_by_name(domain_name)
         except Domain.DoesNotExist:
             raise Http404()
         set_domain(domain)
@@ -18,11 +18,12 @@ from packaging.version import parse as parse_version
 from time import sleep
 from yarl import URL
 
+from pulpcore.constants import TASK_FINAL_STATES
 from pulpcore.tests.functional.utils import (
-    SLEEP_TIME,
     PulpTaskError,
     PulpTaskGroupError,
     add_recording_route,
+    sleep_times,
 )
 
 from pulpcore.client.pulpcore import (
@@ -788,6 +789,7 @@ def delete_orphans_pre(request, orphans_cleanup_api_client, monitor_task):
 @pytest.fixture(scope="session")
 def monitor_task(tasks_api_client, pulp_domain_enabled):
     def _monitor_task(task_href):
+        delays = sleep_times()
         while True:
             try:
                 task = tasks_api_client.read(task_href)
@@ -797,9 +799,9 @@ def monitor_task(tasks_api_client, pulp_domain_enabled):
                     return {}
                 raise e
 
-            if task.state in ["completed", "failed", "canceled"]:
+            if task.state in TASK_FINAL_STATES:
                 break
-            sleep(SLEEP_TIME)
+            sleep(next(delays))
 
         if task.state != "completed":
             raise PulpTaskError(task=task)
@@ -814,8 +816,9 @@ def monitor_task_group(task_groups_api_client):
     def _monitor_task_group(task_group_href):
         task_group = task_groups_api_client.read(task_group_href)
 
+        delays = sleep_times()
         while not task_group.all_tasks_dispatched or (task_group.waiting + task_group.running) > 0:
-            sleep(SLEEP_TIME)
+            sleep(next(delays))
             task_group = task_groups_api_client.read(task_group_href)
 
         if (task_group.failed + task_group.skipped + task_group.canceled) > 0:
@@ -12,6 +12,15 @@ async def get_response(url):
 
 
 SLEEP_TIME = 0.3
+MIN_SLEEP_TIME = 0.05
+
+
+def sleep_times(min_sleep=MIN_SLEEP_TIME, max_sleep=SLEEP_TIME, factor=1.5):
+    """Yield polling intervals that grow exponentially from `min_sleep` up to `max_sleep`."""
+    delay = min_sleep
+    while True:
+        yield delay
+        delay = min(delay * factor, max_sleep)
 
 
 try:
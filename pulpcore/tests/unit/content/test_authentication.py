@@ -0,0 +1,39 @@
+import pytest
+from contextvars import copy_context
+from unittest import mock
+
+from pulpcore.app import util
+from pulpcore.app.models import Domain
+from pulpcore.content import authentication
+from pulpcore.content.handler import PathNotResolved
+
+
+def test_validate_domain_sets_domain(monkeypatch):
+    """
+    The Domain named in the url is returned and set as the current domain.
+    """
+    domain = Domain(name="foo")
+    get_domain_by_name = mock.Mock(return_value=domain)
+    monkeypatch.setattr(authentication, "get_domain_by_name", get_domain_by_name)
+    request = mock.Mock(match_info={"pulp_domain": "foo", "path": "bar/"})
+    ctx = copy_context()
+
+    assert ctx.run(authentication.validate_domain, request) is domain
+    get_domain_by_name.assert_called_once_with("foo")
+    assert ctx.run(util.current_domain.get) is domain
+
+
+@pytest.mark.parametrize(
+    "domain_enabled,expected_path", [(False, "bar/"), (True, "foo/bar/")], ids=["plain", "domains"]
+)
+def test_validate_domain_unknown_domain(monkeypatch, settings, domain_enabled, expected_path):
+    """
+    An unknown domain name raises PathNotResolved, prefixed with the domain name if enabled.
+    """
+    settings.DOMAIN_ENABLED = domain_enabled
+    monkeypatch.setattr(Domain.objects, "get", mock.Mock(side_effect=Domain.DoesNotExist))
+    request = mock.Mock(match_info={"pulp_domain": "foo", "path": "bar/"})
+
+    with pytest.raises(PathNotResolved) as exc_info:
+        copy_context().run(authentication.validate_domain, request)
+    assert exc_info.value.path == expected_path
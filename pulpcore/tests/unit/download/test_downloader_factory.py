@@ -29,3 +29,21 @@ async def test_custom_headers():
     factory = DownloaderFactory(remote)
     downloader = factory.build(remote.url)
     assert downloader.session.headers["Connection"] == "keep-alive"
+
+
+@pytest.mark.asyncio
+async def test_basic_auth_shared():
+    remote = Remote(
+        url="http://example.org/",
+        username="user",
+        password="pass",
+        proxy_url="http://proxy.example.org/",
+        proxy_username="puser",
+        proxy_password="ppass",
+        name="foo",
+    )
+    factory = DownloaderFactory(remote)
+    downloader = factory.build(remote.url)
+    assert downloader.auth.login == "user"
+    assert downloader.proxy_auth.login == "puser"
+    assert factory.build(remote.url).auth is downloader.auth
@@ -0,0 +1,48 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from pulpcore.download import HttpDownloader
+
+
+@pytest_asyncio.fixture
+async def http_server():
+    app = web.Application()
+    app.router.add_get("/{name}", lambda request: web.Response(body=b"content"))
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_default_session():
+    downloader = HttpDownloader("http://example.org/", headers={"Connection": "keep-alive"})
+    try:
+        assert downloader.session.connector.force_close
+        assert downloader.session.headers["Connection"] == "keep-alive"
+    finally:
+        await downloader.session.close()
+
+
+@pytest.mark.asyncio
+async def test_default_session_closed(http_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    downloader = HttpDownloader(f"{http_server}/file")
+    await downloader.run()
+    assert downloader.session.closed
+
+
+@pytest.mark.asyncio
+async def test_shared_session_not_closed(http_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    downloader = HttpDownloader(f"{http_server}/file")
+    shared = HttpDownloader(f"{http_server}/other", session=downloader.session)
+    try:
+        await shared.run()
+        assert not downloader.session.closed
+    finally:
+        await downloader.session.close()
@@ -2,7 +2,7 @@ import pytest
 from time import sleep
 
 import pulpcore.app.redis_connection
-from pulpcore.cache import Cache
+from pulpcore.cache import AsyncContentCache, Cache
 
 
 @pytest.fixture
@@ -106,3 +106,21 @@ def test_clear(pulp_redisdb):
     cache.redis.flushdb()
     for key, _, base_key in tuples:
         assert not cache.exists(key, base_key=base_key)
+
+
+@pytest.mark.asyncio
+async def test_async_bad_entry_deleted(monkeypatch):
+    """Tests that an unusable entry is removed when the content cache reads it"""
+    cache = AsyncContentCache()
+    deleted = []
+
+    async def get(key, base_key=None):
+        return b'{"status": 200}'
+
+    async def delete(key=None, base_key=None):
+        deleted.append((key, base_key))
+
+    monkeypatch.setattr(cache, "get", get)
+    monkeypatch.setattr(cache, "delete", delete)
+    assert await cache.make_response("key", "base") is None
+    assert deleted == [("key", "base")]
@@ -0,0 +1,58 @@
+from contextvars import copy_context
+from unittest import mock
+
+import pytest
+from django.http.response import Http404
+
+from pulpcore import middleware
+from pulpcore.app import util
+from pulpcore.app.models import Domain
+
+
+def test_process_view_sets_domain(monkeypatch):
+    """
+    The domain name is removed from the view kwargs and its Domain is set on the request.
+    """
+    domain = Domain(name="foo")
+    get_domain_by_name = mock.Mock(return_value=domain)
+    monkeypatch.setattr(middleware, "get_domain_by_name", get_domain_by_name)
+    request = mock.Mock()
+    view_kwargs = {"pulp_domain": "foo"}
+    ctx = copy_context()
+
+    ctx.run(middleware.DomainMiddleware(mock.Mock()).process_view, request, None, (), view_kwargs)
+
+    get_domain_by_name.assert_called_once_with("foo")
+    assert request.pulp_domain is domain
+    assert view_kwargs == {}
+    assert ctx.run(util.current_domain.get) is domain
+
+
+def test_process_view_defaults_to_default_domain(monkeypatch):
+    """
+    Without a domain name in the url the "default" domain is used.
+    """
+    get_domain_by_name = mock.Mock(return_value=Domain(name="default"))
+    monkeypatch.setattr(middleware, "get_domain_by_name", get_domain_by_name)
+
+    copy_context().run(
+        middleware.DomainMiddleware(mock.Mock()).process_view, mock.Mock(), None, (), {}
+    )
+
+    get_domain_by_name.assert_called_once_with("default")
+
+
+def test_process_view_unknown_domain(monkeypatch):
+    """
+    An unknown domain name results in a 404.
+    """
+    monkeypatch.setattr(Domain.objects, "get", mock.Mock(side_effect=Domain.DoesNotExist))
+
+    with pytest.raises(Http404):
+        copy_context().run(
+            middleware.DomainMiddleware(mock.Mock()).process_view,
+            mock.Mock(),
+            None,
+            (),
+            {"pulp_domain": "foo"},
+        )
@@ -30,3 +30,26 @@ def test_get_view_name_for_model_not_found(monkeypatch):
     monkeypatch.setattr(util, "get_viewset_for_model", mock.Mock())
     with pytest.raises(LookupError):
         util.get_view_name_for_model(mock.Mock(), "foo")
+
+
+def test_get_domain_by_name_default(monkeypatch):
+    """
+    The default domain is taken from the cache without querying the database.
+    """
+    default_domain = models.Domain(name="default")
+    monkeypatch.setattr(util, "default_domain", default_domain)
+    monkeypatch.setattr(
+        models.Domain.objects, "get", mock.Mock(side_effect=AssertionError("queried"))
+    )
+    assert util.get_domain_by_name("default") is default_domain
+
+
+def test_get_domain_by_name_queries_other_domains(monkeypatch):
+    """
+    Any other domain is looked up in the database.
+    """
+    domain = models.Domain(name="foo")
+    get = mock.Mock(return_value=domain)
+    monkeypatch.setattr(models.Domain.objects, "get", get)
+    assert util.get_domain_by_name("foo") is domain
+    get.assert_called_once_with(name="foo")